@@ -3,46 +3,36 @@ import os
 import asyncio
 import getpass
 import platform
+import random
 import signal
+import ssl
 import sys
+import threading
+import time
 import sqlite3
 import json
+import re
+import secrets
 import aiofiles
 import csv
+import io
+import shutil
+import tempfile
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Tuple
 from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from hashlib import sha256
+from heapq import nlargest
+from operator import itemgetter
 import logging
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from contextlib import asynccontextmanager
-from telethon import TelegramClient, functions, types, __version__ as telethon_version
-from telethon.errors import (
-    SessionPasswordNeededError,
-    FloodWaitError,
-    PhoneNumberInvalidError,
-    PhoneCodeInvalidError,
-    RPCError,
-    PhoneCodeExpiredError
-)
-from telethon.sessions import StringSession
-from telethon.tl.functions.account import (
-    GetAuthorizationsRequest,
-    ResetAuthorizationRequest,
-    UpdateProfileRequest,
-    GetAccountTTLRequest,
-    UpdatePasswordSettingsRequest,
-    GetPasswordRequest
-)
-from telethon.tl.functions.auth import ResendCodeRequest
-from telethon.tl.functions.contacts import DeleteContactsRequest, GetContactsRequest
-from telethon.tl.functions.channels import LeaveChannelRequest
-from telethon.tl.functions.messages import GetDialogsRequest
+from contextlib import asynccontextmanager, nullcontext, suppress
+from importlib import metadata
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich import box
 from rich.prompt import Prompt, Confirm
 from rich.layout import Layout
@@ -51,8 +41,14 @@ from rich.text import Text
 
 # Initialize
 console = Console()
-executor = ThreadPoolExecutor(max_workers=4)
+kdf_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="kdf")
 VERSION = "5.6"
+PHONE_RE = re.compile(r"\+\d{9,14}")
+OTP_RE = re.compile(r"\b(?:login code|verification code|otp)\b\D*(\d{5,7})\b", re.IGNORECASE)
+SESSIONS_CACHE_TTL = 2.0
+AUTHORIZATIONS_CACHE_TTL = 10.0
+SKIP_DIALOG_IDS = frozenset({777000, 429000, 1087968824})
+NAME_POOL = tuple(f"{a}{n}" for a in ("Cyber", "Quantum", "Neon", "Stealth", "Vortex") for n in ("Hacker", "Sentinel", "Phantom", "Rogue", "Titan"))
 
 # Configure logging
 if not os.path.exists('logs'):
@@ -64,9 +60,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+try:
+    telethon_version = metadata.version("telethon")
+except metadata.PackageNotFoundError:
+    from telethon import __version__ as telethon_version
+
+LEGACY_OPENSSL = ssl.OPENSSL_VERSION_INFO < (3,)
+if LEGACY_OPENSSL:
+    logger.warning(f"Python is linked against {ssl.OPENSSL_VERSION}; 2FA key derivation runs without OpenSSL 3 SHA acceleration")
+
 class SecureConfig:
     _instance = None
-    _lock = asyncio.Lock()
     
     def __new__(cls):
         if cls._instance is None:
@@ -85,7 +89,9 @@ class SecureConfig:
         self.RETRY_DELAY = int(os.getenv("RETRY_DELAY", "5"))
         self.BATCH_SIZE = int(os.getenv("BATCH_SIZE", "100"))
         self.CONCURRENT_CONNECTIONS = int(os.getenv("CONCURRENT_CONNECTIONS", "4"))
+        self.WARM_POOL = os.getenv("WARM_POOL", "0") == "1"
         self.TELETHON_VERSION = telethon_version
+        self._db = None
         self._setup_folders()
         self._migrate_database()
     
@@ -116,6 +122,7 @@ class SecureConfig:
                 if col_name not in columns:
                     cursor.execute(sql)
                     logger.info(f"Database migrated: added {col_name} column")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_sessions_stats ON sessions(status, last_used)")
             conn.commit()
 
     def _create_database(self):
@@ -135,9 +142,26 @@ class SecureConfig:
             """)
             conn.execute("CREATE INDEX IF NOT EXISTS idx_phone ON sessions(phone)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_status ON sessions(status)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_stats ON sessions(status, last_used)")
             conn.commit()
             logger.info("Created new sessions database")
 
+    def connection(self) -> sqlite3.Connection:
+        if self._db is None:
+            self._db = sqlite3.connect(self.DB_PATH, timeout=20)
+            self._db.execute("PRAGMA busy_timeout = 20000")
+            self._db.execute("PRAGMA journal_mode = WAL")
+            self._db.execute("PRAGMA synchronous = NORMAL")
+            self._db.execute("PRAGMA temp_store = MEMORY")
+            self._db.execute("PRAGMA mmap_size = 268435456")
+        return self._db
+
+    def close(self):
+        if self._db is not None:
+            self._db.execute("PRAGMA optimize")
+            self._db.close()
+            self._db = None
+
     async def get_available_api(self) -> Dict[str, Any]:
         for api in self.API_POOL:
             if api["limits"]["count"] < 100 or (api["limits"]["last_used"] and (datetime.now(timezone.utc) - api["limits"]["last_used"]).total_seconds() > 3600):
@@ -153,13 +177,81 @@ config = SecureConfig()
 
 @asynccontextmanager
 async def db_connection():
-    conn = sqlite3.connect(config.DB_PATH, timeout=20)
-    conn.execute("PRAGMA busy_timeout = 20000")
+    conn = config.connection()
     try:
         yield conn
     finally:
         conn.commit()
-        conn.close()
+
+def utc_now_iso() -> str:
+    now = time.time()
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(now))}.{int(now * 1e6) % 1000000:06d}+00:00"
+
+def atomic_write(path: str, data: bytes) -> None:
+    directory = os.path.dirname(path) or "."
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
+    dir_fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+class AdaptiveRateLimiter:
+    def __init__(self, rate: float, max_rate: float, max_tokens: int = 5, min_rate: float = 0.2,
+                 alpha: float = 1.1, beta: float = 2.0, delta: float = 0.1):
+        self.rate = rate
+        self.max_rate = max_rate
+        self.max_tokens = max_tokens
+        self.min_rate = min_rate
+        self.alpha = alpha
+        self.beta = beta
+        self.delta = delta
+        self._tokens = float(max_tokens)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.max_tokens, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def on_success(self):
+        self.rate = min(self.max_rate, self.alpha * self.rate, self.rate + self.delta)
+
+    def on_failure(self, seconds: float):
+        self.rate = max(self.min_rate, self.rate / self.beta)
+        self._tokens = 0.0
+        self._updated = time.monotonic() + seconds
+
+chat_limiter = AdaptiveRateLimiter(rate=2.0, max_rate=10.0)
+contact_limiter = AdaptiveRateLimiter(rate=2.0, max_rate=10.0)
+
+CLIENT_KWARGS = {
+    "device_model": f"SessionManager-{platform.node()}",
+    "system_version": platform.system(),
+    "app_version": VERSION,
+    "connection_retries": config.MAX_RETRIES,
+    "retry_delay": config.RETRY_DELAY,
+}
 
 class AdvancedTelegramClient:
     def __init__(self, session_path: str, phone: str):
@@ -168,6 +260,7 @@ class AdvancedTelegramClient:
         self.client = None
         self._me = None
         self._connected = False
+        self._authorizations = None
         
     async def __aenter__(self):
         await self.connect()
@@ -176,9 +269,14 @@ class AdvancedTelegramClient:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.disconnect()
         
-    async def connect(self) -> bool:
+    async def connect(self, show_status: bool = True) -> bool:
         if self._connected:
-            return True
+            if self.client.is_connected():
+                return True
+            self._connected = False
+        from telethon import TelegramClient
+        from telethon.network import ConnectionTcpAbridged
+        from telethon.sessions import StringSession
             
         session = StringSession()
         if os.path.exists(self.session_path):
@@ -195,16 +293,14 @@ class AdvancedTelegramClient:
             session,
             api["API_ID"],
             api["API_HASH"],
-            device_model=f"SessionManager-{platform.node()}",
-            system_version=platform.system(),
-            app_version=VERSION,
-            connection_retries=config.MAX_RETRIES,
-            retry_delay=config.RETRY_DELAY
+            connection=ConnectionTcpAbridged,
+            **CLIENT_KWARGS
         )
         
         for attempt in range(config.MAX_RETRIES):
             try:
-                with console.status(f"[cyan]Connecting to Telegram with API {api['API_ID']}...", spinner="dots"):
+                status = console.status(f"[cyan]Connecting to Telegram with API {api['API_ID']}...", spinner="dots") if show_status else nullcontext()
+                with status:
                     await self.client.connect()
                     if not await self.client.is_user_authorized():
                         console.print(f"[yellow]⚠ Session {self.phone} not authorized[/yellow]")
@@ -214,7 +310,7 @@ class AdvancedTelegramClient:
                     async with db_connection() as conn:
                         conn.execute(
                             "UPDATE sessions SET last_used = ?, session_hash = ? WHERE phone = ?",
-                            (datetime.now(timezone.utc).isoformat(), self._generate_session_hash(), self.phone)
+                            (utc_now_iso(), self._generate_session_hash(), self.phone)
                         )
                     console.print(f"[green]✓ Connected as {self._me.first_name} (ID: {self._me.id})[/green]")
                     logger.info(f"Connected to {self.phone} with API {api['API_ID']}")
@@ -227,13 +323,12 @@ class AdvancedTelegramClient:
         console.print(f"[red]✗ Failed after {config.MAX_RETRIES} attempts[/red]")
         return False
     
-    async def disconnect(self):
+    async def disconnect(self, save: bool = True):
         if self.client and self._connected:
             try:
-                session_string = self.client.session.save()
-                async with aiofiles.open(self.session_path, 'w') as f:
-                    await f.write(session_string)
-                os.chmod(self.session_path, 0o600)
+                if save:
+                    session_string = self.client.session.save()
+                    await asyncio.to_thread(atomic_write, self.session_path, session_string.encode())
                 await self.client.disconnect()
                 self._connected = False
                 console.print("[blue]ℹ Client disconnected[/blue]")
@@ -243,19 +338,36 @@ class AdvancedTelegramClient:
                 logger.error(f"Disconnect failed for {self.phone}: {e}")
         self.client = None
     
-    async def safe_execute(self, request: Any, *args, **kwargs) -> Any:
+    async def safe_execute(self, request: Any, *args, limiter: Optional[AdaptiveRateLimiter] = None, **kwargs) -> Any:
+        from telethon.errors import FloodWaitError
         if not self._connected:
             if not await self.connect():
                 return None
+        if isinstance(request, type):
+            request, args, kwargs = request(*args, **kwargs), (), {}
         for attempt in range(config.MAX_RETRIES):
             try:
+                if limiter:
+                    await limiter.acquire()
                 if callable(request):
-                    return await request(*args, **kwargs)
-                return await self.client(request)
+                    result = await request(*args, **kwargs)
+                else:
+                    result = await self.client(request)
+                if limiter:
+                    limiter.on_success()
+                return result
             except FloodWaitError as e:
                 wait = min(e.seconds, 3600)
+                if limiter:
+                    limiter.on_failure(wait)
                 console.print(f"[yellow]⚠ Flood wait: {wait}s[/yellow]")
-                await asyncio.sleep(wait)
+                await asyncio.sleep(wait + random.uniform(0, min(5, 1 + wait * 0.1)))
+            except (ConnectionError, asyncio.TimeoutError) as e:
+                if attempt == config.MAX_RETRIES - 1:
+                    console.print(f"[red]✗ Operation failed: {e}[/red]")
+                    logger.error(f"Operation failed for {self.phone}: {e}")
+                    raise
+                await asyncio.sleep(min(2 ** attempt + random.random(), 60))
             except Exception as e:
                 if attempt == config.MAX_RETRIES - 1:
                     console.print(f"[red]✗ Operation failed: {e}[/red]")
@@ -264,30 +376,189 @@ class AdvancedTelegramClient:
                 await asyncio.sleep(config.RETRY_DELAY * (2 ** attempt))
         return None
     
+    async def get_authorizations(self) -> Any:
+        from telethon.tl.functions.account import GetAuthorizationsRequest
+        if self._authorizations and time.monotonic() - self._authorizations[0] < AUTHORIZATIONS_CACHE_TTL:
+            return self._authorizations[1]
+        auths = await self.safe_execute(GetAuthorizationsRequest())
+        if auths is not None:
+            self._authorizations = (time.monotonic(), auths)
+        return auths
+
+    def invalidate_authorizations(self) -> None:
+        self._authorizations = None
+
     def _generate_session_hash(self) -> str:
         return sha256(f"{self.phone}{datetime.now().isoformat()}".encode()).hexdigest()[:16]
 
-def print_header(title: str) -> None:
-    console.print(Panel(
+client_pool: Dict[str, AdvancedTelegramClient] = {}
+
+async def get_client(session_path: str, show_status: bool = True) -> Optional[AdvancedTelegramClient]:
+    client = client_pool.get(session_path)
+    if client is None:
+        client = AdvancedTelegramClient(session_path, phone_from_path(session_path))
+    if not await client.connect(show_status=show_status):
+        client_pool.pop(session_path, None)
+        return None
+    client_pool[session_path] = client
+    return client
+
+async def run_on_all(action, sessions: List[str]) -> List[Any]:
+    semaphore = asyncio.Semaphore(config.CONCURRENT_CONNECTIONS)
+    
+    async def run_one(session: str) -> Any:
+        async with semaphore:
+            client = await get_client(session, show_status=False)
+            if client is None:
+                raise ConnectionError(f"Failed to connect to {phone_from_path(session)}")
+            return await action(client)
+    
+    return await asyncio.gather(*(run_one(s) for s in sessions), return_exceptions=True)
+
+async def warm_pool() -> None:
+    sessions = session_paths()
+    if not sessions:
+        return
+    semaphore = asyncio.Semaphore(config.CONCURRENT_CONNECTIONS)
+
+    async def warm(session: str) -> Optional[AdvancedTelegramClient]:
+        async with semaphore:
+            return await get_client(session, show_status=False)
+
+    with console.status(f"[cyan]Connecting {len(sessions)} sessions...", spinner="dots"):
+        clients = await asyncio.gather(*(warm(s) for s in sessions), return_exceptions=True)
+    connected = sum(isinstance(c, AdvancedTelegramClient) for c in clients)
+    logger.info(f"Pre-connected {connected}/{len(sessions)} sessions")
+
+background_tasks: Set[asyncio.Task] = set()
+
+def background_task_done(task: asyncio.Task) -> None:
+    background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Background task failed: {task.exception()}")
+
+def run_in_background(coro) -> asyncio.Task:
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_task_done)
+    return task
+
+async def close_clients():
+    if background_tasks:
+        await asyncio.gather(*background_tasks, return_exceptions=True)
+    clients = list(client_pool.values())
+    client_pool.clear()
+    await asyncio.gather(*(client.disconnect() for client in clients), return_exceptions=True)
+
+async def discard_clients(paths: List[str]) -> None:
+    clients = [client_pool.pop(path) for path in paths if path in client_pool]
+    await asyncio.gather(*(client.disconnect(save=False) for client in clients), return_exceptions=True)
+
+@lru_cache(maxsize=None)
+def header_panel(title: str) -> Panel:
+    return Panel(
         Text(title, style="bold cyan", justify="center"),
         border_style="blue",
         subtitle=f"v{VERSION} | Telethon {telethon_version}",
         subtitle_align="right",
         padding=(0, 2),
         width=60
-    ))
+    )
+
+def print_header(title: str) -> None:
+    console.print(header_panel(title))
 
 def print_message(style: str, symbol: str, message: str):
     console.print(f"[{style}]{symbol}[/] {message}", width=60)
 
+@lru_cache(maxsize=1024)
+def phone_from_path(path: str) -> str:
+    return f"+{os.path.basename(path).removesuffix('.session')}"
+
+sessions_cache: Optional[Tuple[float, int, List[Tuple[str, os.stat_result]]]] = None
+
+def session_entries() -> List[Tuple[str, os.stat_result]]:
+    global sessions_cache
+    now = time.monotonic()
+    if sessions_cache is not None and now - sessions_cache[0] < SESSIONS_CACHE_TTL:
+        return list(sessions_cache[2])
+    mtime = os.stat(config.SESSION_FOLDER).st_mtime_ns
+    if sessions_cache is None or sessions_cache[1] != mtime:
+        with os.scandir(config.SESSION_FOLDER) as it:
+            entries = [(e.path, e.stat()) for e in it if e.name.endswith(".session") and e.is_file()]
+        entries.sort(key=lambda e: e[1].st_mtime_ns, reverse=True)
+    else:
+        entries = sessions_cache[2]
+    sessions_cache = (now, mtime, entries)
+    return list(entries)
+
+def session_paths() -> List[str]:
+    return [path for path, _ in session_entries()]
+
+def invalidate_sessions_cache() -> None:
+    global sessions_cache
+    sessions_cache = None
+
+def report_error(message: str, log_message: str, exc: Exception) -> None:
+    print_message("red", "✗", f"{message}: {exc}")
+    logger.error(f"{log_message}: {exc}", exc_info=exc if logger.isEnabledFor(logging.DEBUG) else None)
+
+async def agetpass(prompt: str) -> str:
+    attrs = None
+    with suppress(Exception):
+        import termios
+        attrs = termios.tcgetattr(sys.stdin.fileno())
+    try:
+        return await run_prompt(getpass.getpass, prompt)
+    except BaseException:
+        if attrs is not None:
+            with suppress(Exception):
+                termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, attrs)
+        raise
+
+def resolve_prompt(future: asyncio.Future, result: Any = None, error: Optional[BaseException] = None) -> None:
+    if future.done():
+        return
+    if error is None:
+        future.set_result(result)
+    else:
+        future.set_exception(error)
+
+async def run_prompt(func, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def target():
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            outcome = (None, e)
+        else:
+            outcome = (result, None)
+        with suppress(RuntimeError):
+            loop.call_soon_threadsafe(resolve_prompt, future, *outcome)
+
+    threading.Thread(target=target, name="prompt", daemon=True).start()
+    return await future
+
+async def aprompt(prompt: str, **kwargs) -> str:
+    return await run_prompt(Prompt.ask, prompt, **kwargs)
+
+async def aconfirm(prompt: str, **kwargs) -> bool:
+    return await run_prompt(Confirm.ask, prompt, **kwargs)
+
 def validate_phone(phone: str) -> bool:
-    phone = phone.strip()
-    return phone.startswith('+') and 10 <= len(phone) <= 15 and phone[1:].isdigit()
+    return PHONE_RE.fullmatch(phone) is not None
 
 async def create_session() -> Optional[str]:
+    from telethon import TelegramClient
+    from telethon.errors import SessionPasswordNeededError, PhoneCodeInvalidError, RPCError, PhoneCodeExpiredError
+    from telethon.network import ConnectionTcpAbridged
+    from telethon.sessions import StringSession
+    from telethon.tl.functions.auth import ResendCodeRequest
     print_header("Create New Session")
     while True:
-        phone = Prompt.ask("[cyan]Enter phone number (e.g., +919741023014, 'q' to quit)[/cyan]")
+        phone = (await aprompt("[cyan]Enter phone number (e.g., +919741023014, 'q' to quit)[/cyan]")).strip()
         if phone.lower() == 'q':
             return None
         if not validate_phone(phone):
@@ -298,19 +569,19 @@ async def create_session() -> Optional[str]:
     session_path = str(config.SESSION_FOLDER / f"{phone[1:]}.session")
     if os.path.exists(session_path):
         print_message("yellow", "⚠", f"Session exists for {phone}")
-        if not Confirm.ask("[yellow]Overwrite existing session?[/yellow]"):
+        if not await aconfirm("[yellow]Overwrite existing session?[/yellow]"):
             return session_path
     
     api = await config.get_available_api()
     session = StringSession()
-    async with TelegramClient(session, api["API_ID"], api["API_HASH"]) as client:
+    async with TelegramClient(session, api["API_ID"], api["API_HASH"], connection=ConnectionTcpAbridged, **CLIENT_KWARGS) as client:
         try:
             with console.status(f"[cyan]Connecting to Telegram with API {api['API_ID']}...", spinner="dots"):
                 await client.connect()
             print_message("blue", "ℹ", f"Sending code to {phone}")
             sent_code = await client.send_code_request(phone)
             for attempt in range(3):
-                code = Prompt.ask("[yellow]Enter the code you received ('q' to quit, 'r' to resend)[/yellow]")
+                code = await aprompt("[yellow]Enter the code you received ('q' to quit, 'r' to resend)[/yellow]")
                 if code.lower() == 'q':
                     return None
                 elif code.lower() == 'r':
@@ -319,8 +590,7 @@ async def create_session() -> Optional[str]:
                         print_message("blue", "ℹ", "Code resent successfully")
                         continue
                     except RPCError as e:
-                        print_message("red", "✗", f"Failed to resend code: {e}")
-                        logger.error(f"Failed to resend code for {phone}: {e}")
+                        report_error("Failed to resend code", f"Failed to resend code for {phone}", e)
                         if "all available options" in str(e).lower():
                             print_message("yellow", "⚠", "All code delivery options exhausted. Wait 5-10 minutes and try again.")
                         return None
@@ -336,7 +606,7 @@ async def create_session() -> Optional[str]:
                     print_message("red", "✗", "Code expired, please resend")
                     continue
                 except SessionPasswordNeededError:
-                    password = getpass.getpass("Enter 2FA password: ")
+                    password = await agetpass("Enter 2FA password: ")
                     try:
                         await client.sign_in(password=password)
                         break
@@ -353,33 +623,30 @@ async def create_session() -> Optional[str]:
                 "id": str(me.id)
             }
             session_string = client.session.save()
-            async with aiofiles.open(session_path, 'w') as f:
-                await f.write(session_string)
-            os.chmod(session_path, 0o600)
+            await asyncio.to_thread(atomic_write, session_path, session_string.encode())
+            invalidate_sessions_cache()
+            now = utc_now_iso()
             async with db_connection() as conn:
                 conn.execute(
                     "INSERT OR REPLACE INTO sessions (phone, path, created_at, last_used, metadata, session_hash, status) VALUES (?, ?, ?, ?, ?, ?, ?)",
-                    (phone, session_path, datetime.now(timezone.utc).isoformat(), 
-                     datetime.now(timezone.utc).isoformat(), json.dumps(metadata), 
+                    (phone, session_path, now, now, json.dumps(metadata), 
                      sha256(phone.encode()).hexdigest()[:16], "active")
                 )
             print_message("green", "✓", f"Signed in successfully as {me.first_name} 💻; remember to not break the ToS or you will risk an account ban!")
             logger.info(f"Session created for {phone} with API {api['API_ID']}")
             return session_path
         except RPCError as e:
-            print_message("red", "✗", f"Telegram error: {e}")
-            logger.error(f"Telegram error for {phone}: {e}")
+            report_error("Telegram error", f"Telegram error for {phone}", e)
             if "all available options" in str(e).lower():
                 print_message("yellow", "⚠", "All code delivery options exhausted. Wait 5-10 minutes and try again.")
             return None
         except Exception as e:
-            print_message("red", "✗", f"Unexpected error: {e}")
-            logger.error(f"Failed to create session for {phone}: {e}")
+            report_error("Unexpected error", f"Failed to create session for {phone}", e)
             return None
 
 async def list_sessions(status_filter: str = "active") -> Optional[List[str]]:
     print_header("List Sessions")
-    sessions = [str(p) for p in config.SESSION_FOLDER.glob("*.session")]
+    sessions = session_paths()
     if not sessions:
         print_message("yellow", "⚠", "No sessions found")
         return None
@@ -387,10 +654,10 @@ async def list_sessions(status_filter: str = "active") -> Optional[List[str]]:
     async with db_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT phone, path, last_used, metadata, session_hash, status FROM sessions WHERE status = ?", (status_filter,))
-        db_sessions = {row[0]: row for row in cursor.fetchall()}
+        db_sessions = {row[0]: row for row in cursor}
         
         for session in sessions[:]:
-            phone = f"+{os.path.basename(session).replace('.session', '')}"
+            phone = phone_from_path(session)
             if phone not in db_sessions and validate_phone(phone):
                 async with AdvancedTelegramClient(session, phone) as client:
                     if await client.connect():
@@ -402,10 +669,10 @@ async def list_sessions(status_filter: str = "active") -> Optional[List[str]]:
                             "premium": me.premium,
                             "id": str(me.id)
                         }
+                        now = utc_now_iso()
                         cursor.execute(
                             "INSERT OR IGNORE INTO sessions (phone, path, created_at, last_used, metadata, session_hash, status) VALUES (?, ?, ?, ?, ?, ?, ?)",
-                            (phone, session, datetime.now(timezone.utc).isoformat(), 
-                             datetime.now(timezone.utc).isoformat(), json.dumps(metadata), 
+                            (phone, session, now, now, json.dumps(metadata), 
                              client._generate_session_hash(), "active")
                         )
                         conn.commit()
@@ -415,7 +682,7 @@ async def list_sessions(status_filter: str = "active") -> Optional[List[str]]:
                         print_message("yellow", "⚠", f"Unverified session: {phone}")
                         cursor.execute(
                             "INSERT OR IGNORE INTO sessions (phone, path, created_at, last_used, metadata, session_hash, status) VALUES (?, ?, ?, ?, ?, ?, ?)",
-                            (phone, session, datetime.now(timezone.utc).isoformat(), None, '{}', 
+                            (phone, session, utc_now_iso(), None, '{}', 
                              sha256(phone.encode()).hexdigest()[:16], "inactive")
                         )
                         conn.commit()
@@ -428,8 +695,8 @@ async def list_sessions(status_filter: str = "active") -> Optional[List[str]]:
     table.add_column("Status", style="green", width=10)
     
     filtered_sessions = []
-    for i, session in enumerate(sorted(sessions, key=os.path.getmtime, reverse=True), 1):
-        phone = f"+{os.path.basename(session).replace('.session', '')}"
+    for i, session in enumerate(sessions, 1):
+        phone = phone_from_path(session)
         if phone in db_sessions:
             row = db_sessions[phone]
             last_used = row[2][:19] if row[2] else "Never"
@@ -444,35 +711,46 @@ async def list_sessions(status_filter: str = "active") -> Optional[List[str]]:
     console.print(table)
     return filtered_sessions
 
+last_session: Optional[str] = None
+
 async def select_and_login() -> Optional['AdvancedTelegramClient']:
+    global last_session
+    if last_session and os.path.exists(last_session):
+        choice = await aprompt(f"[cyan]Press Enter to reuse {phone_from_path(last_session)}, or 'l' to pick another[/cyan]", default="")
+        if not choice.strip():
+            client = await get_client(last_session)
+            if client:
+                return client
+            print_message("red", "✗", f"Failed to connect to {phone_from_path(last_session)}")
     sessions = await list_sessions()
     if not sessions:
         return None
     while True:
-        choice = Prompt.ask(f"[cyan]Select session (1-{len(sessions)}, 'q' to quit)[/cyan]", default="q")
+        choice = await aprompt(f"[cyan]Select session (1-{len(sessions)}, 'q' to quit)[/cyan]", default="q")
         if choice.lower() == 'q':
             return None
         try:
             idx = int(choice) - 1
             if 0 <= idx < len(sessions):
-                phone = f"+{os.path.basename(sessions[idx]).replace('.session', '')}"
-                client = AdvancedTelegramClient(sessions[idx], phone)
-                if await client.connect():
+                client = await get_client(sessions[idx])
+                if client:
+                    last_session = sessions[idx]
                     return client
-                print_message("red", "✗", f"Failed to connect to {phone}")
+                print_message("red", "✗", f"Failed to connect to {phone_from_path(sessions[idx])}")
             else:
                 print_message("red", "✗", f"Invalid choice (1-{len(sessions)})")
         except ValueError:
             print_message("red", "✗", "Invalid input")
-        return None
 
 async def terminate_other_sessions():
+    from telethon.tl.functions.account import ResetAuthorizationRequest
+    from rich.progress import Progress, SpinnerColumn, TextColumn
     print_header("Terminate Other Sessions")
     client = await select_and_login()
     if not client:
         return
     try:
-        auths = await client.safe_execute(GetAuthorizationsRequest())
+        auths = await client.get_authorizations()
         other_sessions = [a for a in auths.authorizations if not a.current]
         if not other_sessions:
             print_message("blue", "ℹ", "No other active sessions found")
@@ -484,22 +762,104 @@ async def terminate_other_sessions():
         table.add_column("Location", style="yellow", width=15)
         table.add_column("Last Active", style="green", width=15)
         for auth in other_sessions:
-            table.add_row(auth.device_model, auth.ip, auth.country, auth.date_active.strftime('%Y-%m-%d %H:%M'))
+            table.add_row(auth.device_model, auth.ip, auth.country, auth.date_active.isoformat(' ', 'minutes')[:16])
         console.print(table)
         
-        if not Confirm.ask("[red]Terminate all other sessions?[/red]"):
+        if not await aconfirm("[red]Terminate all other sessions?[/red]"):
             return
         
-        async with Progress(SpinnerColumn(), TextColumn("{task.description}"), console=console) as progress:
+        semaphore = asyncio.Semaphore(config.CONCURRENT_CONNECTIONS)
+
+        async def terminate(auth):
+            async with semaphore:
+                try:
+                    await client.safe_execute(ResetAuthorizationRequest(hash=auth.hash))
+                except Exception as e:
+                    logger.warning(f"Failed to terminate {auth.device_model} for {client.phone}: {e}")
+                    return auth.device_model, str(e)
+
+        failures = []
+        with Progress(SpinnerColumn(), TextColumn("{task.description}"), console=console) as progress:
             task = progress.add_task("[red]Terminating...", total=len(other_sessions))
-            for auth in other_sessions:
-                await client.safe_execute(ResetAuthorizationRequest, hash=auth.hash)
+            for future in asyncio.as_completed([terminate(a) for a in other_sessions]):
+                failure = await future
+                if failure:
+                    failures.append(failure)
                 progress.update(task, advance=1)
-        print_message("green", "✓", f"Terminated {len(other_sessions)} sessions")
-        logger.info(f"Terminated {len(other_sessions)} sessions for {client.phone}")
+        client.invalidate_authorizations()
+        terminated = len(other_sessions) - len(failures)
+        print_message("green", "✓", f"Terminated {terminated} sessions")
+        if failures:
+            print_failures("Not Terminated", "Device", failures)
+        logger.info(f"Terminated {terminated} sessions for {client.phone}")
     except Exception as e:
-        print_message("red", "✗", f"Failed: {e}")
-        logger.error(f"Failed to terminate sessions for {client.phone}: {e}")
+        report_error("Failed", f"Failed to terminate sessions for {client.phone}", e)
+
+async def reset_other_authorizations(client: AdvancedTelegramClient) -> int:
+    from telethon.tl.functions.account import ResetAuthorizationRequest
+    auths = await client.get_authorizations()
+    other_sessions = [a for a in auths.authorizations if not a.current]
+    semaphore = asyncio.Semaphore(config.CONCURRENT_CONNECTIONS)
+
+    async def terminate(auth):
+        async with semaphore:
+            await client.safe_execute(ResetAuthorizationRequest(hash=auth.hash))
+
+    try:
+        results = await asyncio.gather(*(terminate(a) for a in other_sessions), return_exceptions=True)
+    finally:
+        client.invalidate_authorizations()
+    terminated = 0
+    for auth, result in zip(other_sessions, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Failed to terminate {auth.device_model} for {client.phone}: {result}")
+        else:
+            terminated += 1
+    logger.info(f"Terminated {terminated} sessions for {client.phone}")
+    return terminated
+
+async def count_authorizations(client: AdvancedTelegramClient) -> int:
+    auths = await client.get_authorizations()
+    return len(auths.authorizations)
+
+def print_bulk_results(title: str, sessions: List[str], results: List[Any], label: str) -> None:
+    table = Table(title=title, box=box.ROUNDED, border_style="cyan", width=60)
+    table.add_column("Phone", style="magenta", width=15)
+    table.add_column("Result", style="green", width=45)
+    for session, result in zip(sessions, results):
+        if isinstance(result, Exception):
+            table.add_row(phone_from_path(session), f"[red]Error: {result}[/red]")
+        else:
+            table.add_row(phone_from_path(session), f"{result} {label}")
+    console.print(table)
+
+def print_failures(title: str, label: str, failures: List[Tuple[str, str]]) -> None:
+    table = Table(title=f"[red]{title} ({len(failures)})[/red]", box=box.ROUNDED, border_style="red", width=60)
+    table.add_column(label, style="magenta", width=20)
+    table.add_column("Error", style="red", width=40)
+    for name, error in failures:
+        table.add_row(name, error)
+    console.print(table)
+
+async def terminate_on_all_sessions():
+    print_header("Terminate On All Sessions")
+    sessions = await list_sessions()
+    if not sessions:
+        return
+    if not await aconfirm(f"[red]Terminate other sessions on all {len(sessions)} accounts?[/red]"):
+        return
+    with console.status("[red]Terminating...", spinner="dots"):
+        results = await run_on_all(reset_other_authorizations, sessions)
+    print_bulk_results("Terminated Sessions", sessions, results, "terminated")
+
+async def show_active_on_all_sessions():
+    print_header("Active Sessions On All")
+    sessions = await list_sessions()
+    if not sessions:
+        return
+    with console.status("[cyan]Checking...", spinner="dots"):
+        results = await run_on_all(count_authorizations, sessions)
+    print_bulk_results("Active Sessions", sessions, results, "active")
 
 async def show_active_sessions():
     print_header("Active Sessions")
@@ -507,7 +867,7 @@ async def show_active_sessions():
     if not client:
         return
     try:
-        auths = await client.safe_execute(GetAuthorizationsRequest())
+        auths = await client.get_authorizations()
         table = Table(title=f"Active Sessions ({len(auths.authorizations)})", box=box.ROUNDED, border_style="cyan", width=60)
         table.add_column("Status", style="bold", width=10)
         table.add_column("Device", style="cyan", width=15)
@@ -515,13 +875,13 @@ async def show_active_sessions():
         table.add_column("Last Active", style="green", width=20)
         for auth in auths.authorizations:
             status = "[green]Current[/green]" if auth.current else "[red]Other[/red]"
-            table.add_row(status, auth.device_model, auth.ip, auth.date_active.strftime('%Y-%m-%d %H:%M'))
+            table.add_row(status, auth.device_model, auth.ip, auth.date_active.isoformat(' ', 'minutes')[:16])
         console.print(table)
     except Exception as e:
-        print_message("red", "✗", f"Error: {e}")
-        logger.error(f"Error fetching sessions for {client.phone}: {e}")
+        report_error("Error", f"Error fetching sessions for {client.phone}", e)
 
 async def update_profile_random_name():
+    from telethon.tl.functions.account import UpdateProfileRequest
     print_header("Update Profile")
     client = await select_and_login()
     if not client:
@@ -529,18 +889,17 @@ async def update_profile_random_name():
     try:
         me = await client.client.get_me()
         old_name = f"{me.first_name or ''} {me.last_name or ''}".strip()
-        adjectives = ["Cyber", "Quantum", "Neon", "Stealth", "Vortex"]
-        nouns = ["Hacker", "Sentinel", "Phantom", "Rogue", "Titan"]
-        new_name = f"{adjectives[0]}{nouns[0]}{random.randint(1000, 9999)}"
-        about = Prompt.ask("[cyan]New about text (Enter to skip)[/cyan]", default="")
+        new_name = f"{random.choice(NAME_POOL)}{secrets.token_hex(4)}"
+        about = await aprompt("[cyan]New about text (Enter to skip)[/cyan]", default="")
         await client.safe_execute(UpdateProfileRequest, first_name=new_name, about=about or None)
         print_message("green", "✓", f"Updated from '{old_name}' to '{new_name}'")
         logger.info(f"Profile updated for {client.phone}: {new_name}")
     except Exception as e:
-        print_message("red", "✗", f"Failed: {e}")
-        logger.error(f"Failed to update profile for {client.phone}: {e}")
+        report_error("Failed", f"Failed to update profile for {client.phone}", e)
 
 async def clear_contacts():
+    from telethon.tl.functions.contacts import DeleteContactsRequest, GetContactsRequest
+    from rich.progress import Progress, SpinnerColumn, TextColumn
     print_header("Clear Contacts")
     client = await select_and_login()
     if not client:
@@ -554,85 +913,135 @@ async def clear_contacts():
         table = Table(title=f"Contacts ({len(contacts.contacts)})", box=box.ROUNDED, border_style="magenta", width=60)
         table.add_column("Name", style="magenta", width=30)
         table.add_column("Phone", style="green", width=30)
+        users_by_id = {u.id: u for u in contacts.users}
         for contact in contacts.contacts[:10]:
-            user = next((u for u in contacts.users if u.id == contact.user_id), None)
+            user = users_by_id.get(contact.user_id)
             if user:
                 table.add_row(f"{user.first_name or ''} {user.last_name or ''}".strip(), user.phone or "N/A")
         console.print(table)
         if len(contacts.contacts) > 10:
             print_message("blue", "ℹ", f"...and {len(contacts.contacts) - 10} more")
         
-        if not Confirm.ask("[red]Delete all contacts?[/red]"):
+        if not await aconfirm("[red]Delete all contacts?[/red]"):
             return
         
-        async with Progress(SpinnerColumn(), TextColumn("{task.description}"), console=console) as progress:
-            task = progress.add_task("[red]Deleting...", total=len(contacts.contacts))
-            batches = [contacts.contacts[i:i + config.BATCH_SIZE] for i in range(0, len(contacts.contacts), config.BATCH_SIZE)]
-            for batch in batches:
-                await client.safe_execute(DeleteContactsRequest, id=[c.user_id for c in batch])
-                progress.update(task, advance=len(batch))
-        print_message("green", "✓", f"Deleted {len(contacts.contacts)} contacts")
-        logger.info(f"Deleted {len(contacts.contacts)} contacts for {client.phone}")
+        ids = [c.user_id for c in contacts.contacts]
+        batches = [ids[i:i + config.BATCH_SIZE] for i in range(0, len(ids), config.BATCH_SIZE)]
+        semaphore = asyncio.Semaphore(config.CONCURRENT_CONNECTIONS)
+        with Progress(SpinnerColumn(), TextColumn("{task.description}"), console=console) as progress:
+            task = progress.add_task("[red]Deleting...", total=len(ids))
+
+            async def delete_batch(batch) -> int:
+                async with semaphore:
+                    try:
+                        await client.safe_execute(DeleteContactsRequest(id=batch), limiter=contact_limiter)
+                        return len(batch)
+                    except Exception as e:
+                        logger.warning(f"Failed to delete {len(batch)} contacts for {client.phone}: {e}")
+                        return 0
+                    finally:
+                        progress.update(task, advance=len(batch))
+
+            deleted = sum(await asyncio.gather(*(delete_batch(b) for b in batches)))
+        print_message("green", "✓", f"Deleted {deleted} contacts")
+        if deleted < len(ids):
+            print_message("yellow", "⚠", f"{len(ids) - deleted} contacts could not be deleted")
+        logger.info(f"Deleted {deleted} contacts for {client.phone}")
     except Exception as e:
-        print_message("red", "✗", f"Failed: {e}")
-        logger.error(f"Failed to clear contacts for {client.phone}: {e}")
+        report_error("Failed", f"Failed to clear contacts for {client.phone}", e)
 
 async def delete_all_chats_advanced():
+    from telethon import types
+    from telethon.tl.functions.channels import LeaveChannelRequest
+    from rich.progress import Progress, SpinnerColumn, TextColumn
     print_header("Advanced Chat Deletion")
     client = await select_and_login()
     if not client:
         return
     try:
-        dialogs = await client.safe_execute(GetDialogsRequest, offset_date=None, offset_id=0, offset_peer=types.InputPeerEmpty(), limit=500, hash=0)
-        if not dialogs.dialogs:
+        preview = await client.safe_execute(client.client.get_dialogs, limit=10)
+        if not preview:
             print_message("blue", "ℹ", "No chats or channels found")
             return
         
-        table = Table(title=f"Chats/Channels ({len(dialogs.dialogs)})", box=box.ROUNDED, border_style="yellow", width=60)
+        table = Table(title=f"Chats/Channels ({preview.total})", box=box.ROUNDED, border_style="yellow", width=60)
         table.add_column("Type", style="cyan", width=15)
         table.add_column("Title", style="magenta", width=30)
         table.add_column("Members", style="white", width=15)
-        for dialog in dialogs.dialogs[:10]:
+        for dialog in preview:
             entity = dialog.entity
             chat_type = "Channel" if isinstance(entity, types.Channel) else "Chat"
             members = getattr(entity, 'participants_count', 'N/A')
             table.add_row(chat_type, getattr(entity, 'title', 'Unknown'), str(members))
         console.print(table)
-        if len(dialogs.dialogs) > 10:
-            print_message("blue", "ℹ", f"...and {len(dialogs.dialogs) - 10} more")
+        if preview.total > 10:
+            print_message("blue", "ℹ", f"...and {preview.total - 10} more")
         
-        if not Confirm.ask("[red]Delete all chats and channels?[/red]"):
+        if not await aconfirm("[red]Delete all chats and channels?[/red]"):
             return
         
-        async with Progress(SpinnerColumn(), TextColumn("{task.description}"), console=console) as progress:
-            task = progress.add_task("[red]Deleting...", total=len(dialogs.dialogs))
-            tasks = []
-            for dialog in dialogs.dialogs:
-                if isinstance(dialog.entity, types.Channel):
-                    tasks.append(client.safe_execute(LeaveChannelRequest, channel=dialog.entity))
-                else:
-                    tasks.append(client.client.delete_dialog(dialog.entity))
-                progress.update(task, advance=1)
-            await asyncio.gather(*tasks)
-        print_message("green", "✓", f"Deleted {len(dialogs.dialogs)} chats/channels")
-        logger.info(f"Deleted {len(dialogs.dialogs)} chats/channels for {client.phone}")
+        queue = asyncio.Queue(maxsize=config.CONCURRENT_CONNECTIONS)
+        deleted = 0
+        failures = []
+        
+        async def worker():
+            nonlocal deleted
+            while True:
+                dialog = await queue.get()
+                try:
+                    if isinstance(dialog.entity, types.Channel):
+                        await client.safe_execute(LeaveChannelRequest(dialog.entity), limiter=chat_limiter)
+                    else:
+                        await client.safe_execute(client.client.delete_dialog, dialog.entity, limiter=chat_limiter)
+                    deleted += 1
+                except Exception as e:
+                    failures.append((getattr(dialog.entity, 'title', None) or str(dialog.id), str(e)))
+                    logger.error(f"Failed to delete dialog {dialog.id} for {client.phone}: {e}")
+                finally:
+                    progress.update(task, advance=1)
+                    queue.task_done()
+        
+        with Progress(SpinnerColumn(), TextColumn("{task.description}"), console=console) as progress:
+            task = progress.add_task("[red]Deleting...", total=preview.total)
+            workers = [asyncio.create_task(worker()) for _ in range(config.CONCURRENT_CONNECTIONS)]
+            try:
+                async for dialog in client.client.iter_dialogs():
+                    if dialog.id in SKIP_DIALOG_IDS:
+                        progress.update(task, advance=1)
+                        continue
+                    await queue.put(dialog)
+                await queue.join()
+            finally:
+                for w in workers:
+                    w.cancel()
+        print_message("green", "✓", f"Deleted {deleted} chats/channels")
+        if failures:
+            print_failures("Not Deleted", "Chat", failures)
+        logger.info(f"Deleted {deleted} chats/channels for {client.phone}")
     except Exception as e:
-        print_message("red", "✗", f"Error: {e}")
-        logger.error(f"Error deleting chats for {client.phone}: {e}")
+        report_error("Error", f"Error deleting chats for {client.phone}", e)
 
 async def check_spam_status():
+    from telethon.tl.functions.account import GetAccountTTLRequest, GetPasswordRequest
     print_header("Check Spam Status")
     client = await select_and_login()
     if not client:
         return
     try:
-        ttl = await client.safe_execute(GetAccountTTLRequest)
-        test_msg = await client.safe_execute(client.client.send_message, "me", f"Spam check {datetime.now().isoformat()}")
+        results = await asyncio.gather(
+            client.safe_execute(GetAccountTTLRequest),
+            client.safe_execute(client.client.send_message, "me", f"Spam check {datetime.now().isoformat()}"),
+            client.safe_execute(GetPasswordRequest),
+            return_exceptions=True
+        )
+        ttl, test_msg, password_info = results
+        if test_msg and not isinstance(test_msg, Exception):
+            run_in_background(client.safe_execute(client.client.delete_messages, "me", [test_msg.id]))
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
         status = "[green]Unrestricted[/green]" if test_msg else "[red]Restricted[/red]"
-        if test_msg:
-            await client.safe_execute(client.client.delete_messages, "me", [test_msg.id])
         
-        password_info = await client.safe_execute(GetPasswordRequest)
         has_2fa = "Yes" if password_info.has_password else "No"
         
         table = Table(title="Account Status", box=box.ROUNDED, border_style="green", width=60)
@@ -655,15 +1064,15 @@ async def read_session_otp():
         messages = await client.safe_execute(client.client.get_messages, "Telegram", limit=20)
         otps = []
         for msg in messages:
-            if msg and "login code" in msg.text.lower():
-                code = ''.join(filter(str.isdigit, msg.text))
-                if code:
-                    otps.append((code, msg.date))
+            text = getattr(msg, "text", None) or ""
+            match = OTP_RE.search(text)
+            if match:
+                otps.append((match.group(1), msg.date))
         
         if otps:
-            for code, date in sorted(otps, key=lambda x: x[1], reverse=True)[:3]:
+            for code, date in nlargest(3, otps, key=itemgetter(1)):
                 console.print(Panel(
-                    f"OTP: [bold green]{code}[/bold green]\nReceived: {date.strftime('%Y-%m-%d %H:%M:%S')}",
+                    f"OTP: [bold green]{code}[/bold green]\nReceived: {date.isoformat(' ', 'seconds')[:19]}",
                     title="Login Code",
                     border_style="green",
                     width=60
@@ -672,47 +1081,54 @@ async def read_session_otp():
         else:
             print_message("blue", "ℹ", "No recent OTPs found")
     except Exception as e:
-        print_message("red", "✗", f"Failed: {e}")
-        logger.error(f"Failed to read OTP for {client.phone}: {e}")
+        report_error("Failed", f"Failed to read OTP for {client.phone}", e)
 
 async def manage_2fa():
+    from telethon import functions, types
+    from telethon.tl.functions.account import GetPasswordRequest
     print_header("2FA Management")
     client = await select_and_login()
     if not client:
         return
+    if LEGACY_OPENSSL:
+        print_message("yellow", "⚠", f"{ssl.OPENSSL_VERSION} detected; rebuild Python against OpenSSL 3 for faster 2FA hashing")
     
     async def get_password_hash(password: str) -> bytes:
         password_info = await client.safe_execute(GetPasswordRequest)
         if not password_info or not password_info.current_algo:
             return None
-        return await asyncio.get_event_loop().run_in_executor(
-            executor,
-            lambda: client.client._get_password_hash(password, password_info.current_algo)
+        return await asyncio.get_running_loop().run_in_executor(
+            kdf_executor, client.client._get_password_hash, password, password_info.current_algo
+        )
+    
+    def new_password_algo(salts: bytes):
+        return types.PasswordKdfAlgoSHA256SHA256PBKDF2HMACSHA512iter100000SHA256ModPow(
+            salt1=salts[:32],
+            salt2=salts[32:],
+            g=2,
+            p=bytes.fromhex('c5')
         )
     
     async def enable_2fa():
-        password = getpass.getpass("Enter new 2FA password (min 8 chars): ")
+        password = await agetpass("Enter new 2FA password (min 8 chars): ")
         if len(password) < 8:
             print_message("red", "✗", "Password must be at least 8 characters")
             return
-        confirm_password = getpass.getpass("Confirm password: ")
+        confirm_password = await agetpass("Confirm password: ")
         if password != confirm_password:
             print_message("red", "✗", "Passwords do not match")
             return
-        hint = Prompt.ask("[cyan]Enter password hint (optional)[/cyan]", default="")
-        email = Prompt.ask("[cyan]Enter recovery email (optional)[/cyan]", default="")
+        hint = await aprompt("[cyan]Enter password hint (optional)[/cyan]", default="")
+        email = await aprompt("[cyan]Enter recovery email (optional)[/cyan]", default="")
         
         try:
+            salts = os.urandom(64)
+            password_hash = await get_password_hash(password)
             await client.client(functions.account.UpdatePasswordSettingsRequest(
                 password=types.InputCheckPasswordEmpty(),
                 new_settings=types.account.PasswordInputSettings(
-                    new_algo=types.PasswordKdfAlgoSHA256SHA256PBKDF2HMACSHA512iter100000SHA256ModPow(
-                        salt1=os.urandom(32),
-                        salt2=os.urandom(32),
-                        g=2,
-                        p=bytes.fromhex('c5')
-                    ),
-                    new_password_hash=await get_password_hash(password),
+                    new_algo=new_password_algo(salts),
+                    new_password_hash=password_hash,
                     hint=hint,
                     email=email if email else None
                 )
@@ -720,13 +1136,12 @@ async def manage_2fa():
             print_message("green", "✓", "2FA enabled successfully")
             logger.info(f"2FA enabled for {client.phone}")
         except Exception as e:
-            print_message("red", "✗", f"Failed to enable 2FA: {e}")
-            logger.error(f"Failed to enable 2FA for {client.phone}: {e}")
+            report_error("Failed to enable 2FA", f"Failed to enable 2FA for {client.phone}", e)
     
     async def disable_2fa():
-        if not Confirm.ask("[red]Are you sure you want to disable 2FA?[/red]"):
+        if not await aconfirm("[red]Are you sure you want to disable 2FA?[/red]"):
             return
-        password = getpass.getpass("Enter current 2FA password: ")
+        password = await agetpass("Enter current 2FA password: ")
         try:
             await client.client(functions.account.UpdatePasswordSettingsRequest(
                 password=await get_password_hash(password),
@@ -739,40 +1154,35 @@ async def manage_2fa():
             print_message("green", "✓", "2FA disabled successfully")
             logger.info(f"2FA disabled for {client.phone}")
         except Exception as e:
-            print_message("red", "✗", f"Failed to disable 2FA: {e}")
-            logger.error(f"Failed to disable 2FA for {client.phone}: {e}")
+            report_error("Failed to disable 2FA", f"Failed to disable 2FA for {client.phone}", e)
     
     async def change_2fa_password():
-        current = getpass.getpass("Enter current 2FA password: ")
-        new_pass = getpass.getpass("Enter new 2FA password (min 8 chars): ")
+        current = await agetpass("Enter current 2FA password: ")
+        new_pass = await agetpass("Enter new 2FA password (min 8 chars): ")
         if len(new_pass) < 8:
             print_message("red", "✗", "New password must be at least 8 characters")
             return
-        confirm_new = getpass.getpass("Confirm new password: ")
+        confirm_new = await agetpass("Confirm new password: ")
         if new_pass != confirm_new:
             print_message("red", "✗", "Passwords do not match")
             return
-        hint = Prompt.ask("[cyan]Enter new password hint (optional)[/cyan]", default="")
+        hint = await aprompt("[cyan]Enter new password hint (optional)[/cyan]", default="")
         
         try:
+            salts = os.urandom(64)
+            current_hash, new_hash = await asyncio.gather(get_password_hash(current), get_password_hash(new_pass))
             await client.client(functions.account.UpdatePasswordSettingsRequest(
-                password=await get_password_hash(current),
+                password=current_hash,
                 new_settings=types.account.PasswordInputSettings(
-                    new_algo=types.PasswordKdfAlgoSHA256SHA256PBKDF2HMACSHA512iter100000SHA256ModPow(
-                        salt1=os.urandom(32),
-                        salt2=os.urandom(32),
-                        g=2,
-                        p=bytes.fromhex('c5')
-                    ),
-                    new_password_hash=await get_password_hash(new_pass),
+                    new_algo=new_password_algo(salts),
+                    new_password_hash=new_hash,
                     hint=hint
                 )
             ))
             print_message("green", "✓", "2FA password changed successfully")
             logger.info(f"2FA password changed for {client.phone}")
         except Exception as e:
-            print_message("red", "✗", f"Failed to change 2FA password: {e}")
-            logger.error(f"Failed to change 2FA password for {client.phone}: {e}")
+            report_error("Failed to change 2FA password", f"Failed to change 2FA password for {client.phone}", e)
     
     async def check_2fa_status():
         try:
@@ -785,8 +1195,7 @@ async def manage_2fa():
             table.add_row("Email", "Set" if password_info.has_recovery else "Not set")
             console.print(table)
         except Exception as e:
-            print_message("red", "✗", f"Failed to check 2FA status: {e}")
-            logger.error(f"Failed to check 2FA status for {client.phone}: {e}")
+            report_error("Failed to check 2FA status", f"Failed to check 2FA status for {client.phone}", e)
 
     menu_options = {
         "1": ("Enable 2FA", enable_2fa),
@@ -796,16 +1205,17 @@ async def manage_2fa():
         "5": ("Back", lambda: None)
     }
     
+    table = Table(box=box.ROUNDED, show_header=False, border_style="magenta", width=60)
+    table.add_column("Option", style="cyan", width=10, justify="right")
+    table.add_column("Action", style="magenta", width=50)
+    for num, (desc, _) in menu_options.items():
+        table.add_row(num, desc)
+    
     while True:
         print_header("2FA Management Menu")
-        table = Table(box=box.ROUNDED, show_header=False, border_style="magenta", width=60)
-        table.add_column("Option", style="cyan", width=10, justify="right")
-        table.add_column("Action", style="magenta", width=50)
-        for num, (desc, _) in menu_options.items():
-            table.add_row(num, desc)
         console.print(table)
         
-        choice = Prompt.ask("[cyan]Select option[/cyan]", choices=list(menu_options.keys()))
+        choice = await aprompt("[cyan]Select option[/cyan]", choices=list(menu_options.keys()))
         if choice == "5":
             break
         await menu_options[choice][1]()
@@ -817,35 +1227,30 @@ async def export_sessions():
         return
     try:
         export_path = f"sessions_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(["Phone", "Path", "Created At", "Last Used", "Metadata", "Session Hash", "Status"])
+        count = 0
         async with db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT phone, path, created_at, last_used, metadata, session_hash, status FROM sessions")
-            data = cursor.fetchall()
-        
-        async with aiofiles.open(export_path, 'w', newline='') as f:
-            writer = csv.writer(f)
-            await writer.writerow(["Phone", "Path", "Created At", "Last Used", "Metadata", "Session Hash", "Status"])
-            for row in data:
-                metadata = json.dumps(json.loads(row[4]) if row[4] else {})
-                await writer.writerow([row[0], row[1], row[2], row[3], metadata, row[5], row[6]])
-        
-        print_message("green", "✓", f"Exported {len(data)} sessions to {export_path}")
-        logger.info(f"Exported {len(data)} sessions to {export_path}")
+            for row in conn.execute("SELECT phone, path, created_at, last_used, COALESCE(metadata, '{}'), session_hash, status FROM sessions"):
+                writer.writerow(row)
+                count += 1
+        await asyncio.to_thread(Path(export_path).write_bytes, buffer.getvalue().encode())
+        print_message("green", "✓", f"Exported {count} sessions to {export_path}")
+        logger.info(f"Exported {count} sessions to {export_path}")
     except Exception as e:
-        print_message("red", "✗", f"Failed to export: {e}")
-        logger.error(f"Failed to export sessions: {e}")
+        report_error("Failed to export", "Failed to export sessions", e)
 
 async def session_statistics():
     print_header("Session Statistics")
     try:
         async with db_connection() as conn:
-            cursor = conn.cursor()
-            stats = {
-                "Total Sessions": cursor.execute("SELECT COUNT(*) FROM sessions").fetchone()[0],
-                "Active Sessions": cursor.execute("SELECT COUNT(*) FROM sessions WHERE status = 'active'").fetchone()[0],
-                "Premium Accounts": cursor.execute("SELECT COUNT(*) FROM sessions WHERE json_extract(metadata, '$.premium') = 1").fetchone()[0],
-                "Recently Used (24h)": cursor.execute("SELECT COUNT(*) FROM sessions WHERE last_used > ?", (datetime.now(timezone.utc).replace(hour=0, minute=0, second=0).isoformat(),)).fetchone()[0]
-            }
+            row = conn.execute(
+                "SELECT COUNT(*), TOTAL(status = 'active'), TOTAL(json_extract(metadata, '$.premium') = 1), TOTAL(last_used > ?) FROM sessions",
+                (datetime.now(timezone.utc).replace(hour=0, minute=0, second=0).isoformat(),)
+            ).fetchone()
+            labels = ("Total Sessions", "Active Sessions", "Premium Accounts", "Recently Used (24h)")
+            stats = dict(zip(labels, map(int, row)))
         
         table = Table(title="Session Statistics", box=box.ROUNDED, border_style="blue", width=60)
         table.add_column("Metric", style="cyan", width=20)
@@ -854,47 +1259,60 @@ async def session_statistics():
             table.add_row(metric, str(value))
         console.print(table)
     except Exception as e:
-        print_message("red", "✗", f"Failed: {e}")
-        logger.error(f"Failed to get statistics: {e}")
+        report_error("Failed", "Failed to get statistics", e)
 
 async def backup_sessions():
+    from rich.progress import Progress, SpinnerColumn, TextColumn
     print_header("Backup Sessions")
-    sessions = await list_sessions()
+    sessions = session_paths()
     if not sessions:
+        print_message("yellow", "⚠", "No sessions found")
         return
     
     backup_dir = config.SESSION_FOLDER / "backups" / f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
     backup_dir.mkdir(exist_ok=True)
     
     try:
-        async with Progress(SpinnerColumn(), TextColumn("{task.description}"), console=console) as progress:
-            task = progress.add_task("[green]Backing up...", total=len(sessions))
-            for session in sessions:
-                dest = backup_dir / os.path.basename(session)
-                async with aiofiles.open(session, 'rb') as src, aiofiles.open(dest, 'wb') as dst:
-                    await dst.write(await src.read())
+        semaphore = asyncio.Semaphore(min(32, len(sessions)))
+        
+        async def backup_file(session: str):
+            dest = backup_dir / os.path.basename(session)
+            async with semaphore:
+                await asyncio.to_thread(shutil.copyfile, session, dest)
                 os.chmod(dest, 0o600)
-                progress.update(task, advance=1)
+            progress.update(task, advance=1)
+        
+        with Progress(SpinnerColumn(), TextColumn("{task.description}"), console=console) as progress:
+            task = progress.add_task("[green]Backing up...", total=len(sessions))
+            await asyncio.gather(*(backup_file(s) for s in sessions))
         
         print_message("green", "✓", f"Backed up {len(sessions)} sessions to {backup_dir}")
         logger.info(f"Backed up {len(sessions)} sessions to {backup_dir}")
     except Exception as e:
-        print_message("red", "✗", f"Failed: {e}")
-        logger.error(f"Failed to backup sessions: {e}")
+        report_error("Failed", "Failed to backup sessions", e)
+
+def remove_files(paths: List[str], progress: Any, task: Any) -> None:
+    for path in paths:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        progress.update(task, advance=1)
 
 async def cleanup_sessions():
+    from rich.progress import Progress, SpinnerColumn, TextColumn
     print_header("Cleanup Sessions")
-    sessions = [str(p) for p in config.SESSION_FOLDER.glob("*.session")]
-    if not sessions:
+    entries = session_entries()
+    if not entries:
         print_message("blue", "ℹ", "No sessions to clean")
         return
     
     async with db_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT path FROM sessions WHERE status = 'active'")
-        db_paths = set(row[0] for row in cursor.fetchall())
+        live = {os.path.realpath(row[0]) for row in cursor}
     
-    orphaned = [s for s in sessions if s not in db_paths]
+    orphaned = [(path, st.st_size) for path, st in entries if os.path.realpath(path) not in live]
     if not orphaned:
         print_message("blue", "ℹ", "No orphaned sessions found")
         return
@@ -902,49 +1320,61 @@ async def cleanup_sessions():
     table = Table(title=f"Orphaned Sessions ({len(orphaned)})", box=box.ROUNDED, border_style="yellow", width=60)
     table.add_column("File", style="yellow", width=40)
     table.add_column("Size (KB)", style="white", width=20)
-    for session in orphaned[:10]:
-        size = os.path.getsize(session) / 1024
-        table.add_row(os.path.basename(session), f"{size:.2f}")
+    for session, size in orphaned[:10]:
+        table.add_row(os.path.basename(session), f"{size / 1024:.2f}")
     console.print(table)
     if len(orphaned) > 10:
         print_message("blue", "ℹ", f"...and {len(orphaned) - 10} more")
     
-    if not Confirm.ask("[red]Delete all orphaned sessions?[/red]"):
+    if not await aconfirm("[red]Delete all orphaned sessions?[/red]"):
         return
     
-    async with Progress(SpinnerColumn(), TextColumn("{task.description}"), console=console) as progress:
+    paths = [session for session, _ in orphaned]
+    await discard_clients(paths)
+    with Progress(SpinnerColumn(), TextColumn("{task.description}"), console=console) as progress:
         task = progress.add_task("[red]Cleaning...", total=len(orphaned))
-        for session in orphaned:
-            await asyncio.get_event_loop().run_in_executor(executor, os.remove, session)
-            progress.update(task, advance=1)
+        await asyncio.to_thread(remove_files, paths, progress, task)
+    invalidate_sessions_cache()
     
     print_message("green", "✓", f"Cleaned up {len(orphaned)} orphaned sessions")
     logger.info(f"Cleaned up {len(orphaned)} orphaned sessions")
 
 async def bulk_session_check():
+    from rich.progress import Progress, SpinnerColumn, TextColumn
     print_header("Bulk Session Check")
     sessions = await list_sessions()
     if not sessions:
         return
     
+    semaphore = asyncio.Semaphore(config.CONCURRENT_CONNECTIONS)
+    
     async def check_session(session: str) -> Dict[str, Any]:
-        phone = f"+{os.path.basename(session).replace('.session', '')}"
-        async with AdvancedTelegramClient(session, phone) as client:
+        phone = phone_from_path(session)
+        async with semaphore:
+            client = AdvancedTelegramClient(session, phone)
             try:
-                connected = await client.connect()
+                connected = await client.connect(show_status=False)
                 return {
                     "phone": phone,
                     "status": "[green]Healthy[/green]" if connected else "[red]Invalid[/red]",
                     "name": client._me.first_name if connected else "N/A"
                 }
-            except Exception as e:
-                return {"phone": phone, "status": f"[red]Error: {e}[/red]", "name": "N/A"}
+            finally:
+                await client.disconnect()
     
-    async with Progress(SpinnerColumn(), TextColumn("{task.description}"), console=console) as progress:
+    with Progress(SpinnerColumn(), TextColumn("{task.description}"), console=console) as progress:
         task = progress.add_task("[cyan]Checking...", total=len(sessions))
-        results = await asyncio.gather(*[check_session(s) for s in sessions])
+        outcomes = await asyncio.gather(*[check_session(s) for s in sessions], return_exceptions=True)
         progress.update(task, completed=len(sessions))
     
+    results = []
+    for session, outcome in zip(sessions, outcomes):
+        if isinstance(outcome, Exception):
+            phone = phone_from_path(session)
+            logger.error(f"Health check failed for {phone}: {outcome!r}")
+            outcome = {"phone": phone, "status": f"[red]Error: {outcome!r}[/red]", "name": "N/A"}
+        results.append(outcome)
+    
     table = Table(title="Session Health", box=box.ROUNDED, border_style="cyan", width=60)
     table.add_column("Phone", style="magenta", width=15)
     table.add_column("Status", style="green", width=25)
@@ -954,7 +1384,7 @@ async def bulk_session_check():
     console.print(table)
     
     unhealthy = [r["phone"] for r in results if "Healthy" not in r["status"]]
-    if unhealthy and Confirm.ask("[yellow]Mark unhealthy sessions as inactive?[/yellow]"):
+    if unhealthy and await aconfirm("[yellow]Mark unhealthy sessions as inactive?[/yellow]"):
         async with db_connection() as conn:
             conn.executemany("UPDATE sessions SET status = 'inactive' WHERE phone = ?", [(p,) for p in unhealthy])
         print_message("green", "✓", f"Marked {len(unhealthy)} sessions as inactive")
@@ -966,15 +1396,15 @@ async def add_session_note():
     if not sessions:
         return
     
-    choice = Prompt.ask(f"[cyan]Select session (1-{len(sessions)}, 'q' to quit)[/cyan]", default="q")
+    choice = await aprompt(f"[cyan]Select session (1-{len(sessions)}, 'q' to quit)[/cyan]", default="q")
     if choice.lower() == 'q':
         return
     
     try:
         idx = int(choice) - 1
         if 0 <= idx < len(sessions):
-            phone = f"+{os.path.basename(sessions[idx]).replace('.session', '')}"
-            note = Prompt.ask("[cyan]Enter note for this session[/cyan]")
+            phone = phone_from_path(sessions[idx])
+            note = await aprompt("[cyan]Enter note for this session[/cyan]")
             async with db_connection() as conn:
                 conn.execute("UPDATE sessions SET notes = ? WHERE phone = ?", (note, phone))
             print_message("green", "✓", f"Added note to {phone}")
@@ -1008,18 +1438,20 @@ async def delete_session():
     if not sessions:
         return
     
-    choice = Prompt.ask(f"[cyan]Select session to delete (1-{len(sessions)}, 'q' to quit)[/cyan]", default="q")
+    choice = await aprompt(f"[cyan]Select session to delete (1-{len(sessions)}, 'q' to quit)[/cyan]", default="q")
     if choice.lower() == 'q':
         return
     
     try:
         idx = int(choice) - 1
         if 0 <= idx < len(sessions):
-            phone = f"+{os.path.basename(sessions[idx]).replace('.session', '')}"
-            if Confirm.ask(f"[red]Delete session {phone}? This cannot be undone![/red]"):
+            phone = phone_from_path(sessions[idx])
+            if await aconfirm(f"[red]Delete session {phone}? This cannot be undone![/red]"):
                 async with db_connection() as conn:
                     conn.execute("DELETE FROM sessions WHERE phone = ?", (phone,))
-                os.remove(sessions[idx])
+                await discard_clients([sessions[idx]])
+                await asyncio.to_thread(Path(sessions[idx]).unlink, missing_ok=True)
+                invalidate_sessions_cache()
                 print_message("green", "✓", f"Deleted session {phone}")
                 logger.info(f"Deleted session {phone}")
         else:
@@ -1060,7 +1492,9 @@ async def main():
         "16": ("Add Session Note", add_session_note),
         "17": ("View Session Notes", view_session_notes),
         "18": ("Delete Session", delete_session),
-        "19": ("Exit", lambda: None)
+        "19": ("Terminate On All Sessions", terminate_on_all_sessions),
+        "20": ("Active Sessions On All", show_active_on_all_sessions),
+        "21": ("Exit", lambda: None)
     }
     
     layout = create_main_layout()
@@ -1078,7 +1512,7 @@ async def main():
     
     async def update_footer():
         layout["footer"].update(Panel(
-            f"[blue]Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"[blue]Date: {datetime.now().isoformat(' ', 'seconds')}\n"
             f"Ctrl+C to Exit | Log: logs/session_manager.log[/blue]",
             border_style="blue"
         ))
@@ -1099,30 +1533,63 @@ async def main():
         console.print(f"[{style}]{full_message}[/{style}]", width=60)
         add_status_message(style, full_message)
 
-    while True:
-        await update_header()
-        menu_table = Table(box=box.ROUNDED, header_style="bold magenta", border_style="magenta", width=30)
-        menu_table.add_column("Opt", style="cyan", width=5, justify="right")
-        menu_table.add_column("Action", style="magenta", width=25)
-        for num, (action, _) in menu_options.items():
-            menu_table.add_row(num, action)
-        layout["menu"].update(menu_table)
-        
-        await update_status()
-        with Live(layout, console=console, refresh_per_second=1):
-            await update_footer()
-            choice = Prompt.ask("[cyan]Select option (1-19)[/cyan]", choices=list(menu_options.keys()))
-        
-        if choice == "19":
-            print_message("green", "✓", "Goodbye!")
-            break
-        await menu_options[choice][1]()
+    menu_table = Table(box=box.ROUNDED, header_style="bold magenta", border_style="magenta", width=30)
+    menu_table.add_column("Opt", style="cyan", width=5, justify="right")
+    menu_table.add_column("Action", style="magenta", width=25)
+    for num, (action, _) in menu_options.items():
+        menu_table.add_row(num, action)
+    layout["menu"].update(menu_table)
+
+    try:
+        if config.WARM_POOL:
+            await warm_pool()
+        while True:
+            if console.is_terminal:
+                await update_header()
+                await update_status()
+                with Live(layout, console=console, refresh_per_second=1):
+                    await update_footer()
+                    choice = await aprompt("[cyan]Select option (1-21)[/cyan]", choices=list(menu_options.keys()))
+            else:
+                console.print(menu_table)
+                choice = await aprompt("[cyan]Select option (1-21)[/cyan]", choices=list(menu_options.keys()))
+            
+            if choice == "21":
+                print_message("green", "✓", "Goodbye!")
+                break
+            await menu_options[choice][1]()
+    finally:
+        await close_clients()
+
+def run_profiled():
+    import cProfile
+    import pstats
+    import tracemalloc
+    tracemalloc.start()
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        asyncio.run(main())
+    finally:
+        profiler.disable()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(30)
+        console.print(f"[blue]ℹ Memory: current {current / 1024:.1f} KiB, peak {peak / 1024:.1f} KiB[/blue]")
 
 if __name__ == "__main__":
     signal.signal(signal.SIGINT, lambda s, f: sys.exit(0))
     signal.signal(signal.SIGTERM, lambda s, f: sys.exit(0))
     try:
-        asyncio.run(main())
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    try:
+        if "--profile" in sys.argv:
+            run_profiled()
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         console.print("\n[red]✗ Operation cancelled[/red]")
         sys.exit(0)
@@ -1131,4 +1598,5 @@ if __name__ == "__main__":
         console.print(f"[red]✗ Fatal error: {e}[/red]")
         sys.exit(1)
     finally:
-        executor.shutdown(wait=False)
\ No newline at end of file
+        kdf_executor.shutdown(wait=False)
+        config.close()
\ No newline at end of file